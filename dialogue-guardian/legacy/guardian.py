@@ -3,14 +3,16 @@
 import subprocess
 import logging
 import os
-import re
 import sys
 import xml.etree.ElementTree as ET
 import json
 import srt
+from operator import itemgetter
 from xml.dom.minidom import parseString
 from pathlib import Path
 
+from profanity_matcher import build_profanity_matcher, clean_subtitle_text
+
 # --- Word/Phrase Matching List (ranked by frequency occurance) ---
 matching_words = [
     'fucking', 'fuck', 'shit', 'damn', 'hell', 'ass', 'bitch', 'bastard',
@@ -25,42 +27,35 @@ matching_words = [
 ffprobe_cmd = '/Users/Shared/FFmpegTools/ffprobe'
 
 
+contains_profanity = build_profanity_matcher(matching_words)
+
+
 def get_video_details(filename):
     details = {}
     logging.debug(f"Getting video details for: {filename}")
-    cmd = [ffprobe_cmd, "-v", "error", "-show_entries", "format=duration", "-of",
-    "default=noprint_wrappers=1:nokey=1", filename]
-    ffprobe = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-    stdout, _ = ffprobe.communicate()
-    details["duration"] = stdout.strip()
-
-    cmd = [ffprobe_cmd, "-v", "error", "-select_streams", "a", "-show_entries",
-    "stream=codec_name,channels,channel_layout,sample_rate", "-of", "compact=p=0:nk=1", filename]
-    ffprobe = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-    stdout, _ = ffprobe.communicate()
-    save_channels = 0
-    for line in stdout.strip().split('\n'):
-        parts = line.split('|')
-        if len(parts) >= 3 and parts[2].isdigit():
-            test_channels = int(parts[2])
-            if test_channels > save_channels:
-                details["codec"] = parts[0]; details["samplerate"] = parts[1]; details["channels"] = parts[2]
-                details["audioconfig"] = parts[3] if len(parts) > 3 else ""
-                save_channels = test_channels
-
-    cmd = [ffprobe_cmd, "-v", "error", "-select_streams", "v:0", "-show_entries", "stream=r_frame_rate,width,height",
-    "-of", "default=noprint_wrappers=1:nokey=1", filename]
-    ffprobe = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-    stdout, _ = ffprobe.communicate()
-    lines = stdout.strip().split('\n')
-    if len(lines) >= 3:
-        details["width"] = lines[0]
-        details["height"] = lines[1]
-        framerate_str = lines[2]
-    else:
-        details["width"] = None
-        details["height"] = None
-        framerate_str = None        # Initialize to None to avoid UnboundLocalError
+    # One ffprobe run for format and stream details, instead of one per query
+    cmd = [ffprobe_cmd, "-v", "error", "-show_entries",
+    "format=duration:stream=codec_type,codec_name,channels,channel_layout,sample_rate,width,height,r_frame_rate",
+    "-of", "json", filename]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        info = json.loads(result.stdout)
+    except (subprocess.CalledProcessError, FileNotFoundError, json.JSONDecodeError) as e:
+        logging.error(f"ffprobe failed for {filename}: {e}"); return None
+    streams = info.get("streams", [])
+    details["duration"] = str(info.get("format", {}).get("duration", ""))
+
+    # Keep the audio stream with the most channels (first one wins a tie)
+    audio_streams = [s for s in streams if s.get("codec_type") == "audio" and int(s.get("channels") or 0) > 0]
+    if audio_streams:
+        audio = max(audio_streams, key=lambda s: int(s["channels"]))
+        details["codec"] = audio.get("codec_name", ""); details["samplerate"] = str(audio.get("sample_rate", ""))
+        details["channels"] = str(audio["channels"]); details["audioconfig"] = audio.get("channel_layout", "")
+
+    video = next((s for s in streams if s.get("codec_type") == "video"), {})
+    details["width"] = str(video["width"]) if video.get("width") else None
+    details["height"] = str(video["height"]) if video.get("height") else None
+    framerate_str = video.get("r_frame_rate")
 
     if framerate_str and '/' in framerate_str:
         numerator, denominator = map(int, framerate_str.split('/'))
@@ -81,14 +76,18 @@ def get_video_details(filename):
     return details
 
 
-def time_s_to_rational_str(time_s, frame_duration_s, frame_dur_num, timebase):
+def time_s_to_ticks(time_s, frame_duration_s, frame_dur_num):
     # Floor the frame calculation to ensure we don't exceed the intended time
     num_frames = int(float(time_s) // frame_duration_s)
-    time_ticks = num_frames * frame_dur_num
-    return f"{time_ticks}/{timebase}s"
+    return num_frames * frame_dur_num
 
 
 def create_fcpxml(video_path, video_info):
+    # Path pieces used throughout: "/dir/movie.mp4" -> "/dir/movie", "movie.mp4", "movie"
+    base_path = os.path.splitext(video_path)[0]
+    file_name = os.path.basename(video_path)
+    project_name = os.path.splitext(file_name)[0]
+
     root = ET.Element("fcpxml", version="1.9")
     resources = ET.SubElement(root, "resources")
 
@@ -113,14 +112,13 @@ def create_fcpxml(video_path, video_info):
     ET.SubElement(resources, "format", id=format_id_sequence, name=format_name, frameDuration=f"{frame_dur_num}/{timebase}s", width=video_info['width'], height=video_info['height'])
 
     asset_id = "r3"
-    asset = ET.SubElement(resources, "asset", id=asset_id, name=os.path.basename(video_path), duration=duration_str, hasVideo="1", hasAudio="1", format=format_id_asset, audioChannels=video_info['channels'], audioRate=video_info['samplerate'])
+    asset = ET.SubElement(resources, "asset", id=asset_id, name=file_name, duration=duration_str, hasVideo="1", hasAudio="1", format=format_id_asset, audioChannels=video_info['channels'], audioRate=video_info['samplerate'])
 
     ET.SubElement(asset, "media-rep", kind="original-media", src=Path(video_path).as_uri())
 
     library = ET.SubElement(root, "library", location="file:///Users/Shared/")
     event = ET.SubElement(library, "event", name="Imported Media")
 
-    project_name = os.path.splitext(os.path.basename(video_path))[0]
     project = ET.SubElement(event, "project", name=project_name)
 
     audio_layout = 'stereo' if int(video_info['channels']) <= 2 else 'surround'
@@ -147,12 +145,12 @@ def create_fcpxml(video_path, video_info):
     volume_param = ET.SubElement(adjust_volume, "param", name="amount")
     keyframe_anim = ET.SubElement(volume_param, "keyframeAnimation")
 
-    keyframes = [(time_s_to_rational_str(0, frame_duration_s, frame_dur_num, timebase), '0dB')]
+    # Keyframes hold integer ticks; they become "<ticks>/<timebase>s" strings only when written
+    keyframes = [(0, '0dB')]
 
-    srt_path = os.path.splitext(video_path)[0] + '.srt'
+    srt_path = base_path + '.srt'
     if not os.path.exists(srt_path):
         # Check for language-specific SRT files
-        base_path = os.path.splitext(video_path)[0]
         for lang in ['en', 'fr', 'es', 'de', 'it']:  # Add more languages as needed
             lang_srt_path = f"{base_path}.{lang}.srt"
             if os.path.exists(lang_srt_path):
@@ -162,20 +160,16 @@ def create_fcpxml(video_path, video_info):
     try:
         with open(srt_path, 'r', encoding='utf-8-sig') as f:
             srt_content = f.read()
-        subs = list(srt.parse(srt_content))     # The library does all the work
+        # Lazy generator: cues are built one at a time as the loop below consumes them
+        subs = srt.parse(srt_content)
     except FileNotFoundError:
         logging.error(f"SRT file not found: {srt_path}"); return ET.ElementTree(root)
 
-    # Build a single regex pattern to find any of the words/phrases as whole words.
-    pattern = r'\b(' + '|'.join(re.escape(word) for word in matching_words) + r')\b'
-    censor_pattern = re.compile(pattern, re.IGNORECASE)
     fade_s = 0.2
 
     for sub in subs:
-        # Clean the content from the object
-        cleaned_text = re.sub(r'[^\w\s\']', '', sub.content).lower()
-
-        if censor_pattern.search(cleaned_text):
+        cleaned_text = clean_subtitle_text(sub.content)
+        if contains_profanity(cleaned_text):
             logging.debug(f"Match found in subtitle #{sub.index}: \"{cleaned_text}\"")
             try:
                 # Get start/end times directly in seconds from timedelta objects
@@ -184,27 +178,33 @@ def create_fcpxml(video_path, video_info):
 
                 # The keyframe generation logic is the same, but now it's triggered correctly
                 keyframes.extend([
-                    (time_s_to_rational_str(start_s - fade_s, frame_duration_s, frame_dur_num, timebase), '0dB'),
-                    (time_s_to_rational_str(start_s, frame_duration_s, frame_dur_num, timebase), '-96dB'),
-                    (time_s_to_rational_str(end_s, frame_duration_s, frame_dur_num, timebase), '-96dB'),
-                    (time_s_to_rational_str(end_s + fade_s, frame_duration_s, frame_dur_num, timebase), '0dB')
+                    (time_s_to_ticks(start_s - fade_s, frame_duration_s, frame_dur_num), '0dB'),
+                    (time_s_to_ticks(start_s, frame_duration_s, frame_dur_num), '-96dB'),
+                    (time_s_to_ticks(end_s, frame_duration_s, frame_dur_num), '-96dB'),
+                    (time_s_to_ticks(end_s + fade_s, frame_duration_s, frame_dur_num), '0dB')
                 ])
             except (ValueError, KeyError) as e:
                 logging.error(f"Could not process subtitle #{sub.get('index', 'N/A')}: {e}")
                 continue
 
-    final_keyframes = sorted(list(dict.fromkeys(keyframes)), key=lambda x: int(x[0].split('/')[0]))
+    final_keyframes = sorted(dict.fromkeys(keyframes), key=itemgetter(0))
     logging.info(f"Generated {len(final_keyframes)} unique keyframes for volume adjustment.")
 
-    for time_str, value_val in final_keyframes:
-        ET.SubElement(keyframe_anim, "keyframe", time=time_str, value=value_val)
+    for time_ticks, value_val in final_keyframes:
+        ET.SubElement(keyframe_anim, "keyframe", time=f"{time_ticks}/{timebase}s", value=value_val)
 
     tree = ET.ElementTree(root)
-    prettyxml = parseString(ET.tostring(root, 'utf-8')).toprettyxml(indent="    ")
 
-    fcpxml_path = os.path.splitext(video_path)[0] + '.fcpxml'
+    fcpxml_path = base_path + '.fcpxml'
     logging.info(f"Writing FCPXML to: {fcpxml_path}")
-    with open(fcpxml_path, "w", encoding="utf-8") as f: f.write(prettyxml)
+    if hasattr(ET, 'indent'):
+        # Python 3.9+: indent in place and write the tree directly, no serialize/re-parse round trip
+        ET.indent(tree, space="    ")
+        with open(fcpxml_path, "wb") as f: tree.write(f, encoding='utf-8', xml_declaration=True)
+    else:
+        # Python 3.7/3.8 only: pretty-print by re-parsing the serialized tree with minidom
+        with open(fcpxml_path, "w", encoding="utf-8") as f:
+            parseString(ET.tostring(root, 'utf-8')).writexml(f, addindent="    ", newl="\n")
     return tree
 
 
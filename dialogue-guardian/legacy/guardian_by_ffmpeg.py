@@ -3,11 +3,12 @@
 import subprocess
 import logging
 import os
-import re
 import sys
 import json
 import srt
 
+from profanity_matcher import build_profanity_matcher, clean_subtitle_text     # Shared with guardian.py
+
 # --- Word/Phrase Matching List (ranked by frequency occurrence) ---
 matching_words = [
     'fucking', 'fuck', 'shit', 'damn', 'hell', 'ass', 'bitch', 'bastard',
@@ -25,6 +26,10 @@ ffprobe_cmd = '/Users/Shared/FFmpegTools/ffprobe'
 ffmpeg_cmd = '/Users/Shared/FFmpegTools/ffmpeg'
 
 
+# Built from this script's own word list, so edits above take effect here
+contains_profanity = build_profanity_matcher(matching_words)
+
+
 def get_video_details(filename):
     """
     Extracts video and audio details using ffprobe.
@@ -249,15 +254,11 @@ def censor_audio_with_ffmpeg(video_path):
         # If no subtitles, proceed without censoring, just copy video/audio
         audio_filter_graph = "anull"
     else:
-        # Build a single regex pattern to find any of the words/phrases as whole words.
-        pattern = r'\b(' + '|'.join(re.escape(word) for word in matching_words) + r')\b'
-        censor_pattern = re.compile(pattern, re.IGNORECASE)
-
         censor_segments = []    # List of (start_s, end_s) tuples for segments to mute
 
         for sub in subs:
-            cleaned_text = re.sub(r'[^\w\s\']', '', sub.content).lower()
-            if censor_pattern.search(cleaned_text):
+            cleaned_text = clean_subtitle_text(sub.content)
+            if contains_profanity(cleaned_text):
                 logging.debug(f"Match found in subtitle #{sub.index}: \"{cleaned_text}\"")
                 start_s = sub.start.total_seconds()
                 end_s = sub.end.total_seconds()
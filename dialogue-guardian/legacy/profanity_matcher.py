@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: 2025 Tony Snearly
+# SPDX-License-Identifier: OSL-3.0
+"""
+Subtitle cleaning and whole-word profanity matching shared by guardian.py and guardian_by_ffmpeg.py.
+"""
+import re
+
+try:
+    import ahocorasick      # Optional: linear-time multi-word scan instead of regex alternation
+except ImportError:
+    ahocorasick = None
+
+
+class _CleanTable(dict):
+    # str.translate table that deletes what r"[^\w\s']" matches; code points are classified on first use
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        value = char if char.isalnum() or char.isspace() or char in "_'" else None
+        self[codepoint] = value
+        return value
+
+
+_CLEAN_TABLE = _CleanTable()
+
+
+def clean_subtitle_text(text):
+    # Same result as re.sub(r"[^\w\s']", '', text).lower(); lower() runs on the whole string so 'Σ' folds in context
+    return text.translate(_CLEAN_TABLE).lower()
+
+
+def _is_word_boundary(text, i):
+    # Regex \b: a word character on exactly one side of position i
+    before = i > 0 and (text[i - 1].isalnum() or text[i - 1] == '_')
+    after = i < len(text) and (text[i].isalnum() or text[i] == '_')
+    return before != after
+
+
+def build_profanity_matcher(words):
+    """
+    Returns a contains(text) function: True if any of words appears as a whole word, ignoring case.
+    Uses a pyahocorasick automaton when installed (one scan, whatever the list size), else a compiled regex.
+    """
+    # Longest first, so the regex tries 'fucking' before 'fuck'
+    words = sorted({word.lower() for word in words}, key=lambda word: (-len(word), word))
+    if ahocorasick is None:
+        pattern = re.compile(r'\b(?:' + '|'.join(map(re.escape, words)) + r')\b', re.IGNORECASE)
+        return lambda text: pattern.search(text) is not None
+
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+
+    def contains(text):
+        lowered = text.lower()
+        for end, word in automaton.iter(lowered):
+            if _is_word_boundary(lowered, end - len(word) + 1) and _is_word_boundary(lowered, end + 1):
+                return True
+        return False
+    return contains
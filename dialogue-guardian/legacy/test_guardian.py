@@ -7,17 +7,39 @@ Unit tests for guardian.py
 
 from guardian import (
     get_video_details,
-    create_fcpxml
+    create_fcpxml,
+    contains_profanity
 )
 import unittest
 from unittest.mock import patch, MagicMock, mock_open
+import json
 import os
+import subprocess
 import sys
 import tempfile
 
 # Import the functions we want to test
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# SRT payloads shared by the create_fcpxml tests
+_SRT_PROFANE = "1\n00:00:05,500 --> 00:00:07,000\nThis is a fucking test.\n"
+_SRT_CLEAN = "1\n00:00:05,500 --> 00:00:07,000\nThis is a clean test.\n"
+_SRT_HELL = "1\n00:00:01,000 --> 00:00:02,000\nWhat the hell?\n"
+
+# clean_subtitle_text() output for typical cues, and whether create_fcpxml should mute them
+_CLEANED_CUES = [
+    ("idon'ti know what the hell's going on", True),
+    ("son of a bitch", True),
+    ("son of a gun", False),
+    ("fuckingawesome", False),
+    ("shitty weather", False),
+    ("jack off", True),
+    ("jack offers help", False),
+    ("motherfucker", True),
+    ("pass the scissors", False),
+    ("", False),
+]
+
 
 class TestGuardian(unittest.TestCase):
     """Test cases for guardian.py functionality"""
@@ -45,38 +67,44 @@ class TestGuardian(unittest.TestCase):
         import shutil
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
-    @patch('subprocess.Popen')
-    def test_get_video_details_success(self, mock_popen):
+    @patch('subprocess.run')
+    def test_get_video_details_success(self, mock_run):
         """Test successful video details extraction"""
-        # Mock ffprobe responses
-        mock_process = MagicMock()
-        mock_process.communicate.side_effect = [
-            ("120.5\n", ""),  # duration
-            ("aac|48000|2|stereo\n", ""),  # audio info
-            ("1920\n1080\n30000/1001\n", "")  # video info
-        ]
-        mock_popen.return_value = mock_process
+        # Mock the single ffprobe JSON response
+        mock_run.return_value = MagicMock(stdout=json.dumps({
+            "format": {"duration": "120.5"},
+            "streams": [
+                {"codec_type": "video", "width": 1920, "height": 1080, "r_frame_rate": "30000/1001"},
+                {"codec_type": "audio", "codec_name": "aac", "sample_rate": "48000", "channels": 2,
+                 "channel_layout": "stereo"},
+            ]
+        }))
 
         with patch('guardian.ffprobe_cmd', './ffprobe'):
             result = get_video_details(self.test_video_path)
 
         self.assertIsNotNone(result)
+        self.assertEqual(mock_run.call_count, 1)
         self.assertEqual(result['duration'], "120.5")
         self.assertEqual(result['width'], "1920")
         self.assertEqual(result['height'], "1080")
         self.assertEqual(result['fps'], "29.970")
         self.assertEqual(result['channels'], "2")
+        self.assertEqual(result['codec'], "aac")
+        self.assertEqual(result['samplerate'], "48000")
+        self.assertEqual(result['audioconfig'], "stereo")
 
-    @patch('subprocess.Popen')
-    def test_get_video_details_integer_framerate(self, mock_popen):
+    @patch('subprocess.run')
+    def test_get_video_details_integer_framerate(self, mock_run):
         """Test video details extraction with integer framerate"""
-        mock_process = MagicMock()
-        mock_process.communicate.side_effect = [
-            ("60.0\n", ""),
-            ("pcm_s16le|44100|1|mono\n", ""),
-            ("1280\n720\n30\n", "")
-        ]
-        mock_popen.return_value = mock_process
+        mock_run.return_value = MagicMock(stdout=json.dumps({
+            "format": {"duration": "60.0"},
+            "streams": [
+                {"codec_type": "video", "width": 1280, "height": 720, "r_frame_rate": "30"},
+                {"codec_type": "audio", "codec_name": "pcm_s16le", "sample_rate": "44100", "channels": 1,
+                 "channel_layout": "mono"},
+            ]
+        }))
 
         with patch('guardian.ffprobe_cmd', './ffprobe'):
             result = get_video_details(self.test_video_path)
@@ -84,6 +112,43 @@ class TestGuardian(unittest.TestCase):
         self.assertEqual(result['fps'], "30.000")
         self.assertEqual(result['framerate'], "30000/1000")
 
+    @patch('subprocess.run')
+    def test_get_video_details_most_channels(self, mock_run):
+        """Test that the audio stream with the most channels is reported"""
+        mock_run.return_value = MagicMock(stdout=json.dumps({
+            "format": {"duration": "60.0"},
+            "streams": [
+                {"codec_type": "audio", "codec_name": "aac", "sample_rate": "48000", "channels": 2,
+                 "channel_layout": "stereo"},
+                {"codec_type": "audio", "codec_name": "ac3", "sample_rate": "48000", "channels": 6,
+                 "channel_layout": "5.1(side)"},
+            ]
+        }))
+
+        with patch('guardian.ffprobe_cmd', './ffprobe'):
+            result = get_video_details(self.test_video_path)
+
+        self.assertEqual(result['codec'], "ac3")
+        self.assertEqual(result['channels'], "6")
+        self.assertIsNone(result['width'])
+        self.assertIsNone(result['fps'])
+
+    @patch('subprocess.run')
+    def test_get_video_details_ffprobe_failure(self, mock_run):
+        """Test that an ffprobe failure returns None"""
+        mock_run.side_effect = subprocess.CalledProcessError(1, 'ffprobe')
+
+        with patch('guardian.ffprobe_cmd', './ffprobe'):
+            result = get_video_details(self.test_video_path)
+
+        self.assertIsNone(result)
+
+    def test_contains_profanity_on_cleaned_cues(self):
+        """Test matching on cue text in the form create_fcpxml passes it"""
+        for text, expected in _CLEANED_CUES:
+            with self.subTest(text=text):
+                self.assertEqual(contains_profanity(text), expected)
+
     @patch('os.path.exists')
     @patch('builtins.open', new_callable=mock_open)
     def test_create_fcpxml_no_srt(self, mock_file, mock_exists):
@@ -100,7 +165,7 @@ class TestGuardian(unittest.TestCase):
         self.assertEqual(keyframes[0].get("value"), "0dB")
 
     @patch('os.path.exists')
-    @patch('builtins.open', new_callable=mock_open, read_data="1\n00:00:05,500 --> 00:00:07,000\nThis is a fucking test.\n")
+    @patch('builtins.open', new_callable=mock_open, read_data=_SRT_PROFANE)
     @patch('srt.parse')
     def test_create_fcpxml_with_profanity(self, mock_srt_parse, mock_open_file, mock_exists):
         """Test FCPXML creation with a profane SRT file"""
@@ -126,7 +191,28 @@ class TestGuardian(unittest.TestCase):
         self.assertIn('-96dB', values)
 
     @patch('os.path.exists')
-    @patch('builtins.open', new_callable=mock_open, read_data="1\n00:00:05,500 --> 00:00:07,000\nThis is a clean test.\n")
+    @patch('builtins.open', new_callable=mock_open, read_data=_SRT_PROFANE)
+    @patch('srt.parse')
+    def test_create_fcpxml_matches_cleaned_text(self, mock_srt_parse, mock_open_file, mock_exists):
+        """Test that profanity is matched on the cleaned cue text, as guardian_by_ffmpeg does"""
+        mock_exists.return_value = True
+        cases = {"F.u.c.k!": True, "Oh sh.it": True, "<i>fuck</i>": False, "f-f-fuck": False}
+
+        for content, muted in cases.items():
+            with self.subTest(content=content):
+                mock_subtitle = MagicMock()
+                mock_subtitle.start.total_seconds.return_value = 5.5
+                mock_subtitle.end.total_seconds.return_value = 7.0
+                mock_subtitle.content = content
+                mock_subtitle.index = 1
+                mock_srt_parse.return_value = [mock_subtitle]
+
+                root = create_fcpxml(self.test_video_path, self.video_info).getroot()
+                values = [k.get("value") for k in root.iter("keyframe")]
+                self.assertEqual('-96dB' in values, muted)
+
+    @patch('os.path.exists')
+    @patch('builtins.open', new_callable=mock_open, read_data=_SRT_CLEAN)
     @patch('srt.parse')
     def test_create_fcpxml_no_profanity(self, mock_srt_parse, mock_open_file, mock_exists):
         """Test FCPXML creation with a clean SRT file"""
@@ -150,7 +236,7 @@ class TestGuardian(unittest.TestCase):
         self.assertEqual(keyframes[0].get("value"), "0dB")
 
     @patch('os.path.exists')
-    @patch('builtins.open', new_callable=mock_open, read_data="1\n00:00:01,000 --> 00:00:02,000\nWhat the hell?\n")
+    @patch('builtins.open', new_callable=mock_open, read_data=_SRT_HELL)
     @patch('srt.parse')
     def test_create_fcpxml_language_srt(self, mock_srt_parse, mock_open_file, mock_exists):
         """Test FCPXML creation with a language-specific SRT file"""
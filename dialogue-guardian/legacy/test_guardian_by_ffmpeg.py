@@ -9,7 +9,8 @@ from guardian_by_ffmpeg import (
     get_video_details,
     extract_embedded_srt,
     censor_audio_with_ffmpeg,
-    matching_words
+    matching_words,
+    contains_profanity
 )
 import unittest
 from unittest.mock import patch, MagicMock, mock_open
@@ -253,24 +254,27 @@ class TestGuardianByFFmpeg(unittest.TestCase):
         for word in matching_words:
             self.assertIsInstance(word, str)
 
-    def test_regex_pattern_compilation(self):
-        """Test that the profanity regex pattern compiles correctly"""
-        import re
-        pattern = r'\b(' + '|'.join(re.escape(word) for word in matching_words) + r')\b'
-        compiled_pattern = re.compile(pattern, re.IGNORECASE)
+    def test_contains_profanity_covers_word_list(self):
+        """Test that every entry in this script's word list is censored on its own and inside a cue"""
+        for word in matching_words:
+            with self.subTest(word=word):
+                self.assertTrue(contains_profanity(word))
+                self.assertTrue(contains_profanity(f"well {word.upper()} then"))
 
-        # Test pattern matches expected words
+    def test_profanity_pattern_matching(self):
+        """Test whole-word matching on cue text as censor_audio_with_ffmpeg cleans it"""
         test_cases = [
-            ("This is fucking bad", True),
-            ("Clean content", False),
-            ("What the hell", True),
-            ("Hello world", False),
-            ("SHIT happens", True),  # Test case insensitivity
+            ("this is fucking bad", True),
+            ("clean content", False),
+            ("what the hell", True),
+            ("hello world", False),
+            ("shit happens", True),
+            ("shitty content", False),   # Part of a longer word
+            ("hard one", False),         # Phrase 'hard on' must end on a word boundary
         ]
 
         for text, should_match in test_cases:
-            match = compiled_pattern.search(text.lower())
-            self.assertEqual(bool(match), should_match, f"Failed for text: {text}")
+            self.assertEqual(contains_profanity(text), should_match, f"Failed for text: {text}")
 
 
 class TestIntegration(unittest.TestCase):
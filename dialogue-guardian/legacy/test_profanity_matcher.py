@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2025 Tony Snearly
+# SPDX-License-Identifier: OSL-3.0
+"""
+Unit tests for profanity_matcher.py
+"""
+
+import profanity_matcher
+from profanity_matcher import (
+    build_profanity_matcher,
+    clean_subtitle_text
+)
+import unittest
+from unittest.mock import patch
+
+
+class TestProfanityMatcher(unittest.TestCase):
+    """Test cases for the matcher shared by the legacy scripts"""
+
+    words = ['darn', 'heck', 'gosh darn', 'dang it']
+
+    def test_clean_subtitle_text(self):
+        """Test that cues are stripped of punctuation and lowercased before matching"""
+        self.assertEqual(clean_subtitle_text("F.u.c.k!"), "fuck")
+        self.assertEqual(clean_subtitle_text("<i>Don't</i> sh.it"), "idon'ti shit")
+        self.assertEqual(clean_subtitle_text("f-f-fuck"), "fffuck")
+        self.assertEqual(clean_subtitle_text("ΟΔΟΣ"), "οδος")
+
+    def test_matches_whole_words_only(self):
+        """Test that words and phrases match case-insensitively on word boundaries"""
+        contains = build_profanity_matcher(self.words)
+        self.assertTrue(contains("well GOSH DARN it"))
+        self.assertTrue(contains("oh heck no"))
+        self.assertFalse(contains("darned socks"))
+        self.assertFalse(contains("dang items"))
+        self.assertFalse(contains(""))
+
+    @unittest.skipUnless(profanity_matcher.ahocorasick is not None, "pyahocorasick not installed")
+    def test_automaton_matches_regex_fallback(self):
+        """Test that the Aho-Corasick matcher decides exactly like the regex fallback"""
+        with patch('profanity_matcher.ahocorasick', None):
+            regex_contains = build_profanity_matcher(self.words)
+        automaton_contains = build_profanity_matcher(self.words)
+        texts = ["gosh darn", "gosh  darn", "darn_it", "oh heck's", "dang it all", "dang itself", "Darn"]
+        for text in texts:
+            with self.subTest(text=text):
+                self.assertEqual(automaton_contains(text), regex_contains(text))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,16 +12,174 @@ import re
 import subprocess
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Pattern, Tuple
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple, Union
 
 import srt  # type: ignore
 
+_loads: Callable[[Union[str, bytes]], Any]
+
+try:
+    import orjson  # type: ignore
+
+    # orjson parses ffprobe's JSON straight from bytes, in C
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+try:
+    import av  # type: ignore
+except ImportError:
+    av = None  # type: ignore[assignment]
+
+try:
+    import ahocorasick  # type: ignore
+except ImportError:
+    ahocorasick = None
+
+
+class _SubtitleCleanTable(dict):
+    """
+    str.translate table that deletes the characters matched by [^\\w\\s'].
+
+    Code points are classified on first sight and memoized, so the table
+    covers all of Unicode without being built up front. Lowercasing is left
+    to str.lower() on the whole result, since some mappings (final sigma)
+    depend on the surrounding characters.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[str]:
+        char = chr(codepoint)
+        # \w is isalnum() plus "_", and \s is isspace()
+        keep = char.isalnum() or char.isspace() or char in "_'"
+        value = char if keep else None
+        self[codepoint] = value
+        return value
+
+
+_CLEAN_TABLE = _SubtitleCleanTable()
+
+# Sidecar subtitle suffixes, in lookup priority order
+_SRT_SUFFIXES = (".srt", ".en.srt", ".fr.srt", ".es.srt", ".de.srt", ".it.srt")
+
+
+def _read_srt(srt_path: str) -> List[srt.Subtitle]:
+    """Read and parse an SRT file."""
+    with open(srt_path, "r", encoding="utf-8-sig") as f:
+        return list(srt.parse(f.read()))
+
+
+@lru_cache(maxsize=32)
+def _framerate_fields(framerate_str: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Compute (framerate, fps, frameduration) strings for an ffprobe frame rate.
+
+    Cached because a handful of rates ("24/1", "30000/1001", ...) cover
+    nearly every stream.
+    """
+    if "/" in framerate_str:
+        numerator_str, _, denominator_str = framerate_str.partition("/")
+        try:
+            numerator, denominator = int(numerator_str), int(denominator_str)
+        except ValueError:
+            # Invalid framerate format
+            return None, None, None
+        if denominator == 0:
+            return None, None, None
+        return framerate_str, f"{numerator / denominator:.3f}", f"{denominator}/{numerator}"
+
+    try:
+        fps_float = float(framerate_str)
+        # round() so e.g. "29.97" gives 29970 rather than 29969 from float error
+        millis = round(fps_float * 1000)
+    except (ValueError, OverflowError):
+        # Invalid framerate format, including "nan" and "inf"
+        return None, None, None
+    return f"{millis}/1000", f"{fps_float:.3f}", f"1000/{millis}"
+
+
+def _is_word_char(char: str) -> bool:
+    """Return True for the characters regex \\w matches."""
+    return char.isalnum() or char == "_"
+
+
+class _AhoCorasickPattern:
+    """
+    Whole-word, case-insensitive word matcher backed by a pyahocorasick automaton.
+
+    Provides the search() subset of re.Pattern used by the censoring code, and
+    accepts a match only where the regex's \\b anchors would.
+    """
+
+    def __init__(self, words: Tuple[str, ...]):
+        self._automaton = ahocorasick.Automaton()
+        for word in words:
+            if word:
+                self._automaton.add_word(word.lower(), word.lower())
+        self._automaton.make_automaton()
+
+    @staticmethod
+    def _is_boundary(text: str, index: int) -> bool:
+        before = index > 0 and _is_word_char(text[index - 1])
+        after = index < len(text) and _is_word_char(text[index])
+        return before != after
+
+    def search(self, text: str) -> Optional[str]:
+        """Return the first whole-word match in text, or None."""
+        lowered = text.lower()
+        for end, word in self._automaton.iter(lowered):
+            start = end - len(word) + 1
+            if self._is_boundary(lowered, start) and self._is_boundary(lowered, end + 1):
+                return word
+        return None
+
+
+ProfanityMatcher = Union[Pattern[str], _AhoCorasickPattern]
+
+
+def _compile_profanity_regex(words: Tuple[str, ...]) -> Pattern[str]:
+    """Compile a whole-word, case-insensitive alternation of the given words."""
+    if not words:
+        # Return pattern that matches nothing
+        return re.compile(r"(?!.*)", re.IGNORECASE)
+
+    pattern = r"\b(" + "|".join(re.escape(word) for word in words) + r")\b"
+    return re.compile(pattern, re.IGNORECASE)
+
+
+@lru_cache(maxsize=8)
+def _compile_profanity(words: Tuple[str, ...]) -> ProfanityMatcher:
+    """
+    Build the matcher for a word list, using Aho-Corasick when available.
+
+    Cached so processors sharing a word list share one matcher.
+    """
+    if ahocorasick is not None and words:
+        return _AhoCorasickPattern(words)
+    return _compile_profanity_regex(words)
+
 
 @dataclass
 class SegmentDiagnostic:
     """Diagnostic information for a single censored segment."""
 
+    # One instance per censored segment; slots drop the per-instance __dict__.
+    # Declared by hand because dataclass(slots=True) needs Python 3.10.
+    __slots__ = (
+        "segment_id",
+        "start_time",
+        "end_time",
+        "duration",
+        "target_rms_db",
+        "actual_rms_db",
+        "meets_threshold",
+        "strategy_used",
+        "strategy_name",
+        "filter_applied",
+    )
+
     segment_id: int
     start_time: float
     end_time: float
@@ -38,6 +196,22 @@ class SegmentDiagnostic:
 class CensoringDiagnostic:
     """Complete diagnostic report for a censoring operation."""
 
+    __slots__ = (
+        "timestamp",
+        "input_video",
+        "output_video",
+        "total_segments",
+        "total_censored_duration",
+        "successful_segments",
+        "failed_segments",
+        "final_strategy_used",
+        "fallback_attempts",
+        "overall_success",
+        "segments",
+        "error_messages",
+        "recommendations",
+    )
+
     timestamp: str
     input_video: str
     output_video: str
@@ -112,6 +286,52 @@ class GuardianProcessor:
         "faggot",
     ]
 
+    # Fixed stages of the censoring filter chain
+    _FORMAT_NORMALIZATION_FILTER = "aformat=sample_fmts=s16:channel_layouts=stereo"
+    _COMPRESSION_FILTER = "acompressor=threshold=-20dB:ratio=20:attack=5:release=50"
+    _NULL_MIXING_FILTERS = (
+        "volume=-60dB",  # First stage: very low volume
+        "volume=0",  # Second stage: zero volume
+        "agate=threshold=-90dB:ratio=10:attack=1:release=10",  # Noise gate
+    )
+
+    # Static arguments of the censoring FFmpeg command, see _build_ffmpeg_base_command()
+    _FFMPEG_CODEC_ARGS = ("-c:v", "copy", "-c:a", "aac", "-b:a", "192k")
+    _FFMPEG_OUTPUT_ARGS = ("-map_metadata", "-1", "-movflags", "+faststart", "-y")
+
+    # Segments measured per FFmpeg run by _verify_silence_levels(); each one is a separate input
+    _VERIFY_BATCH_SIZE = 32
+    # Log prefix of the Nth astats filter in a filter graph, e.g. "[Parsed_astats_0 @ 0x...]"
+    _ASTATS_INSTANCE_RE = re.compile(r"^\[Parsed_astats_(\d+) @[^\]]*\]")
+
+    # Filter configuration per strategy level, see _get_filter_strategy()
+    _FILTER_STRATEGIES: Dict[int, Dict[str, Any]] = {
+        1: {
+            "name": "Basic Volume Reduction",
+            "volume_filter": "volume=0",
+            "use_format_normalization": False,
+            "use_compression": False,
+            "use_null_mixing": False,
+            "description": "Simple volume=0 filter (legacy approach)",
+        },
+        2: {
+            "name": "Enhanced Silence",
+            "volume_filter": "volume=-80dB",
+            "use_format_normalization": True,
+            "use_compression": True,
+            "use_null_mixing": False,
+            "description": ("Very low volume reduction with format normalization and" " compression"),
+        },
+        3: {
+            "name": "Aggressive Null Mixing",
+            "volume_filter": "volume=0",
+            "use_format_normalization": True,
+            "use_compression": True,
+            "use_null_mixing": True,
+            "description": ("Complete silence with null source mixing and multiple processing" " stages"),
+        },
+    }
+
     def __init__(
         self,
         matching_words: Optional[List[str]] = None,
@@ -130,6 +350,37 @@ class GuardianProcessor:
         self.matching_words = matching_words if matching_words is not None else self.DEFAULT_MATCHING_WORDS
         self.ffmpeg_cmd = ffmpeg_cmd or self._get_local_ffmpeg_cmd("ffmpeg")
         self.ffprobe_cmd = ffprobe_cmd or self._get_local_ffmpeg_cmd("ffprobe")
+        # get_video_details results keyed by (absolute path, mtime_ns, size)
+        self._video_details_cache: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+    @property
+    def matching_words(self) -> List[str]:
+        """
+        Words and phrases to censor.
+
+        Assigning a new list rebuilds the compiled pattern. Mutating the list
+        in place does not, so assign a new list to change the words.
+        """
+        return self._matching_words
+
+    @matching_words.setter
+    def matching_words(self, words: List[str]) -> None:
+        self._matching_words = words
+        self._censor_pattern = (
+            self.default_censor_pattern()
+            if words is self.DEFAULT_MATCHING_WORDS
+            else self._build_profanity_pattern(words)
+        )
+
+    @classmethod
+    def default_censor_pattern(cls) -> ProfanityMatcher:
+        """
+        Return the compiled pattern for DEFAULT_MATCHING_WORDS.
+
+        Compilation is cached, so every processor that uses the default word
+        list shares the same pattern.
+        """
+        return cls._build_profanity_pattern(cls.DEFAULT_MATCHING_WORDS)
 
     def _get_local_ffmpeg_cmd(self, cmd_name: str) -> str:
         """
@@ -160,36 +411,39 @@ class GuardianProcessor:
         """
         return {"duration": duration_output.strip()}
 
-    def _parse_audio_streams(self, ffprobe_output: str) -> Dict[str, str]:
+    def _parse_audio_streams(self, streams: List[Dict[str, Any]]) -> Dict[str, str]:
         """
-        Parse ffprobe audio stream output and select the best audio stream.
+        Select the best audio stream from ffprobe JSON stream entries.
 
         Args:
-            ffprobe_output: Raw output from ffprobe audio stream query
+            streams: Stream dictionaries from ffprobe's JSON output
 
         Returns:
             Dictionary with codec, samplerate, channels, and audioconfig
 
         This function is extracted to be testable without mocking subprocess.
         """
-        best_audio = {"codec": "", "samplerate": "", "channels": "", "audioconfig": ""}
-        save_channels = 0
-
-        for line in ffprobe_output.split("\n"):
-            if not line.strip():
-                continue
-
-            parts = line.split("|")
-            if len(parts) >= 3 and parts[2].isdigit():
-                test_channels = int(parts[2])
-                if test_channels > save_channels:
-                    best_audio["codec"] = parts[0]
-                    best_audio["samplerate"] = parts[1]
-                    best_audio["channels"] = parts[2]
-                    best_audio["audioconfig"] = parts[3] if len(parts) > 3 else ""
-                    save_channels = test_channels
-
-        return best_audio
+        # max() keeps the first stream among equals, as ffprobe lists them
+        best = max(
+            (
+                stream
+                for stream in streams
+                if stream.get("codec_type") == "audio"
+                and isinstance(stream.get("channels"), int)
+                and stream["channels"] > 0
+            ),
+            key=itemgetter("channels"),
+            default=None,
+        )
+        if best is None:
+            return {"codec": "", "samplerate": "", "channels": "", "audioconfig": ""}
+
+        return {
+            "codec": best.get("codec_name", ""),
+            "samplerate": str(best.get("sample_rate", "")),
+            "channels": str(best["channels"]),
+            "audioconfig": best.get("channel_layout", ""),
+        }
 
     def _parse_framerate_info(self, framerate_str: Optional[str]) -> Dict[str, Optional[str]]:
         """
@@ -203,66 +457,31 @@ class GuardianProcessor:
 
         This function is extracted to be testable without mocking subprocess.
         """
-        framerate_info: Dict[str, Optional[str]] = {
-            "framerate": None,
-            "fps": None,
-            "frameduration": None,
-        }
+        framerate, fps, frameduration = _framerate_fields(framerate_str) if framerate_str else (None, None, None)
+        return {"framerate": framerate, "fps": fps, "frameduration": frameduration}
 
-        if not framerate_str:
-            return framerate_info
-
-        if "/" in framerate_str:
-            try:
-                numerator, denominator = map(int, framerate_str.split("/"))
-                if denominator != 0:
-                    framerate_info["framerate"] = framerate_str
-                    framerate_info["fps"] = "{:.3f}".format(numerator / denominator)
-                    framerate_info["frameduration"] = f"{denominator}/{numerator}"
-                # If denominator is 0, leave all values as None
-            except (ValueError, ZeroDivisionError):
-                # Invalid framerate format, leave as None
-                pass
-        else:
-            try:
-                fps_float = float(framerate_str)
-                framerate_info["fps"] = f"{fps_float:.3f}"
-                framerate_info["framerate"] = f"{int(fps_float * 1000)}/1000"
-                framerate_info["frameduration"] = f"1000/{int(fps_float * 1000)}"
-            except ValueError:
-                # Invalid framerate format, leave as None
-                pass
-
-        return framerate_info
-
-    def _parse_video_stream_output(self, ffprobe_output: str) -> Dict[str, Optional[str]]:
+    def _parse_video_stream(self, streams: List[Dict[str, Any]]) -> Dict[str, Optional[str]]:
         """
-        Parse ffprobe video stream output to extract width, height, and framerate.
+        Extract width, height, and framerate from the first video stream.
 
         Args:
-            ffprobe_output: Raw output from ffprobe video stream query
+            streams: Stream dictionaries from ffprobe's JSON output
 
         Returns:
             Dictionary with width, height, and framerate info
 
         This function is extracted to be testable without mocking subprocess.
         """
-        lines = ffprobe_output.split("\n")
         video_info: Dict[str, Optional[str]] = {"width": None, "height": None}
+        framerate_str = None
 
-        # Parse width (first line)
-        if len(lines) >= 1 and lines[0]:
-            video_info["width"] = lines[0]
-
-        # Parse height (second line)
-        if len(lines) >= 2 and lines[1]:
-            video_info["height"] = lines[1]
-
-        # Parse framerate (third line)
-        if len(lines) >= 3 and lines[2]:
-            framerate_str = lines[2]
-        else:
-            framerate_str = None
+        video = next((stream for stream in streams if stream.get("codec_type") == "video"), None)
+        if video is not None:
+            if video.get("width"):
+                video_info["width"] = str(video["width"])
+            if video.get("height"):
+                video_info["height"] = str(video["height"])
+            framerate_str = video.get("r_frame_rate")
 
         # Parse framerate information
         framerate_info = self._parse_framerate_info(framerate_str)
@@ -270,10 +489,88 @@ class GuardianProcessor:
 
         return video_info
 
+    def _parse_video_details(self, probe_output: Union[str, bytes]) -> Dict[str, Any]:
+        """
+        Parse ffprobe's combined format/stream JSON into a video details dictionary.
+
+        Args:
+            probe_output: Raw JSON output from ffprobe
+
+        Returns:
+            Dictionary with duration, audio, and video details
+
+        This function is extracted to be testable without mocking subprocess.
+        """
+        probe = _loads(probe_output)
+        streams = probe.get("streams", [])
+
+        details: Dict[str, Any] = {}
+        details.update(self._parse_duration(str(probe.get("format", {}).get("duration", ""))))
+        details.update(self._parse_audio_streams(streams))
+        details.update(self._parse_video_stream(streams))
+        return details
+
+    def _get_video_details_pyav(self, filename: str) -> Optional[Dict[str, Any]]:
+        """
+        Extracts video and audio details in-process using PyAV.
+
+        Produces the same keys and string formats as the ffprobe path so the
+        two backends are interchangeable.
+
+        Args:
+            filename: Path to the video file.
+
+        Returns:
+            Dictionary of video details, or None if PyAV could not read the file.
+        """
+        try:
+            with av.open(filename) as container:
+                duration = f"{container.duration / av.time_base:.6f}" if container.duration is not None else ""
+
+                # Describe the streams the way ffprobe's JSON does and reuse its parsers
+                streams: List[Dict[str, Any]] = []
+                for stream in container.streams.audio:
+                    codec_context = stream.codec_context
+                    streams.append(
+                        {
+                            "codec_type": "audio",
+                            "codec_name": codec_context.name,
+                            "sample_rate": str(codec_context.sample_rate),
+                            "channels": codec_context.channels,
+                            "channel_layout": codec_context.layout.name if codec_context.layout else "",
+                        }
+                    )
+                if container.streams.video:
+                    video = container.streams.video[0]
+                    # base_rate is ffprobe's r_frame_rate
+                    rate = video.base_rate or video.average_rate
+                    streams.append(
+                        {
+                            "codec_type": "video",
+                            "width": video.codec_context.width,
+                            "height": video.codec_context.height,
+                            "r_frame_rate": f"{rate.numerator}/{rate.denominator}" if rate is not None else None,
+                        }
+                    )
+        except Exception as e:
+            logging.debug(f"PyAV could not read {filename}, falling back to ffprobe: {e}")
+            return None
+
+        details: Dict[str, Any] = {}
+        details.update(self._parse_duration(duration))
+        details.update(self._parse_audio_streams(streams))
+        details.update(self._parse_video_stream(streams))
+        return details
+
     def get_video_details(self, filename: str) -> Optional[Dict[str, Any]]:
         """
         Extracts video and audio details using ffprobe.
 
+        When PyAV is installed the details are read in-process instead, and
+        ffprobe is only spawned if PyAV cannot open the file. Results are
+        cached per processor until the file's modification time or size
+        changes.
+
         Args:
             filename: Path to the video file.
 
@@ -281,64 +578,58 @@ class GuardianProcessor:
             Dictionary containing video duration, audio codec, sample rate,
             channels, video width, height, and frame rate.
         """
-        details: Dict[str, Any] = {}
-        logging.debug(f"Getting video details for: {filename}")
-
         try:
-            # Get video duration
-            cmd_duration = [
-                self.ffprobe_cmd,
-                "-v",
-                "error",
-                "-show_entries",
-                "format=duration",
-                "-of",
-                "default=noprint_wrappers=1:nokey=1",
-                filename,
-            ]
-            stdout_duration = subprocess.check_output(cmd_duration, text=True, stderr=subprocess.PIPE).strip()
+            stat = os.stat(filename)
+        except OSError:
+            # Let the probe report the missing/unreadable file
+            return self._probe_video_details(filename)
+
+        cache_key = (os.path.abspath(filename), stat.st_mtime_ns, stat.st_size)
+        details = self._video_details_cache.get(cache_key)
+        if details is None:
+            details = self._probe_video_details(filename)
+            if details is None:
+                return None
+            self._video_details_cache[cache_key] = details
+        else:
+            logging.debug(f"Using cached video details for: {filename}")
+        # Hand out a copy so callers cannot modify the cached entry
+        return dict(details)
 
-            # Parse duration using extracted function
-            duration_info = self._parse_duration(stdout_duration)
-            details.update(duration_info)
+    def _probe_video_details(self, filename: str) -> Optional[Dict[str, Any]]:
+        """
+        Read video and audio details with PyAV or ffprobe, bypassing the cache.
 
-            # Get audio stream details
-            cmd_audio = [
-                self.ffprobe_cmd,
-                "-v",
-                "error",
-                "-select_streams",
-                "a",
-                "-show_entries",
-                "stream=codec_name,channels,channel_layout,sample_rate",
-                "-of",
-                "compact=p=0:nk=1",
-                filename,
-            ]
-            stdout_audio = subprocess.check_output(cmd_audio, text=True, stderr=subprocess.PIPE).strip()
+        Args:
+            filename: Path to the video file.
 
-            # Parse audio streams using extracted function
-            audio_info = self._parse_audio_streams(stdout_audio)
-            details.update(audio_info)
+        Returns:
+            Dictionary of video details, or None if the file cannot be probed.
+        """
+        logging.debug(f"Getting video details for: {filename}")
+
+        if av is not None:
+            pyav_details = self._get_video_details_pyav(filename)
+            if pyav_details is not None:
+                logging.debug(f"Video Info Dictionary:\n{json.dumps(pyav_details, indent=4)}")
+                return pyav_details
 
-            # Get video stream details
-            cmd_video = [
+        try:
+            # Probe format and all streams in a single ffprobe call
+            cmd_probe = [
                 self.ffprobe_cmd,
                 "-v",
                 "error",
-                "-select_streams",
-                "v:0",
                 "-show_entries",
-                "stream=r_frame_rate,width,height",
+                "format=duration:stream=codec_type,codec_name,channels,channel_layout,sample_rate,"
+                "width,height,r_frame_rate",
                 "-of",
-                "default=noprint_wrappers=1:nokey=1",
+                "json",
                 filename,
             ]
-            stdout_video = subprocess.check_output(cmd_video, text=True, stderr=subprocess.PIPE).strip()
+            probe_output = subprocess.check_output(cmd_probe, stderr=subprocess.PIPE)
 
-            # Parse video stream using extracted function
-            video_info = self._parse_video_stream_output(stdout_video)
-            details.update(video_info)
+            details = self._parse_video_details(probe_output)
 
             logging.debug(f"Video Info Dictionary:\n{json.dumps(details, indent=4)}")
             return details
@@ -348,8 +639,11 @@ class GuardianProcessor:
         except FileNotFoundError:
             logging.error("ffprobe not found. Please ensure FFmpeg is installed and in " "your system's PATH.")
             return None
+        except json.JSONDecodeError as e:
+            logging.error(f"Failed to parse ffprobe JSON output: {e}")
+            return None
 
-    def _parse_ffprobe_streams(self, json_output: str) -> List[Dict[str, Any]]:
+    def _parse_ffprobe_streams(self, json_output: Union[str, bytes]) -> List[Dict[str, Any]]:
         """
         Parse ffprobe JSON output to extract stream information.
 
@@ -362,7 +656,7 @@ class GuardianProcessor:
         This function is extracted to be testable without mocking subprocess.
         """
         try:
-            probe_output = json.loads(json_output)
+            probe_output = _loads(json_output)
             return probe_output.get("streams", [])
         except json.JSONDecodeError:
             return []
@@ -397,16 +691,17 @@ class GuardianProcessor:
 
         This function is extracted to be testable without mocking subprocess.
         """
-        if not srt_streams:
-            return None
-
-        # Prioritize default SRT track
+        first_index = None
         for stream in srt_streams:
+            index = stream["index"]
+            # Prioritize default SRT track
             if stream.get("disposition", {}).get("default") == 1:
-                return stream["index"]
+                return index
+            if first_index is None:
+                first_index = index
 
         # If no default, pick the first one
-        return srt_streams[0]["index"]
+        return first_index
 
     def _generate_srt_candidates(self, video_path: str) -> List[str]:
         """
@@ -421,13 +716,7 @@ class GuardianProcessor:
         This function is extracted to be testable without mocking file system.
         """
         base_path = os.path.splitext(video_path)[0]
-        candidates = [f"{base_path}.srt"]
-
-        # Add language-specific variants
-        for lang in ["en", "fr", "es", "de", "it"]:
-            candidates.append(f"{base_path}.{lang}.srt")
-
-        return candidates
+        return [base_path + suffix for suffix in _SRT_SUFFIXES]
 
     def _find_first_existing_file(self, candidates: List[str]) -> Optional[str]:
         """
@@ -459,7 +748,7 @@ class GuardianProcessor:
             True if an SRT track was successfully extracted, False otherwise.
         """
         logging.info(f"Checking for embedded SRT subtitles in {video_path}")
-        probe_output_raw = ""
+        probe_output_raw: Union[str, bytes] = ""
 
         try:
             # Use ffprobe to list all streams in JSON format
@@ -476,7 +765,8 @@ class GuardianProcessor:
                 video_path,
             ]
 
-            probe_output_raw = subprocess.check_output(cmd_probe_streams, text=True, stderr=subprocess.PIPE).strip()
+            # Keep the output as bytes; both JSON backends accept it directly
+            probe_output_raw = subprocess.check_output(cmd_probe_streams, stderr=subprocess.PIPE).strip()
 
             # Parse streams using extracted function
             streams = self._parse_ffprobe_streams(probe_output_raw)
@@ -547,12 +837,22 @@ class GuardianProcessor:
 
         return found_file
 
-    def _parse_srt_file(self, srt_path: str) -> Optional[List[srt.Subtitle]]:
-        """Parses an SRT file and returns a list of subtitles."""
+    def _parse_srt_file(
+        self, srt_path: str, load: Callable[[str], List[srt.Subtitle]] = _read_srt
+    ) -> Optional[List[srt.Subtitle]]:
+        """
+        Parses an SRT file and returns a list of subtitles.
+
+        Args:
+            srt_path: Path to the SRT file
+            load: Reads and parses srt_path. Tests can pass a plain function
+                instead of patching open() and srt.parse.
+
+        Returns:
+            List of subtitles, or None if the file cannot be read or parsed
+        """
         try:
-            with open(srt_path, "r", encoding="utf-8-sig") as f:
-                srt_content = f.read()
-            return list(srt.parse(srt_content))
+            return load(srt_path)
         except Exception as e:
             logging.error(f"Error reading or parsing SRT file {srt_path}: {e}")
             return None
@@ -569,54 +869,59 @@ class GuardianProcessor:
 
         This function is extracted to be testable without mocking subtitles.
         """
-        return re.sub(r"[^\w\s\']", "", content).lower()
+        return content.translate(_CLEAN_TABLE).lower()
 
-    def _build_profanity_pattern(self, words: List[str]) -> Pattern[str]:
+    @staticmethod
+    def _build_profanity_pattern(words: List[str]) -> ProfanityMatcher:
         """
-        Build compiled regex pattern for profanity detection.
+        Build compiled pattern for profanity detection.
+
+        Uses a pyahocorasick automaton when the package is installed, and a
+        regex alternation otherwise; both match whole words case-insensitively.
 
         Args:
             words: List of words to match
 
         Returns:
-            Compiled regex pattern
+            Compiled pattern exposing search()
 
         This function is extracted to be testable without mocking.
         """
-        if not words:
-            # Return pattern that matches nothing
-            return re.compile(r"(?!.*)", re.IGNORECASE)
-
-        pattern = r"\b(" + "|".join(re.escape(word) for word in words) + r")\b"
-        return re.compile(pattern, re.IGNORECASE)
+        # Longest words first, so phrases are tried before their prefixes; the
+        # canonical order also gives equal word sets the same cache key.
+        return _compile_profanity(tuple(sorted(set(words), key=lambda word: (-len(word), word))))
 
-    def _contains_profanity(self, text: str, pattern: Pattern[str]) -> bool:
+    def _contains_profanity(self, text: str, pattern: Optional[ProfanityMatcher] = None) -> bool:
         """
         Check if text contains profanity using the given pattern.
 
         Args:
             text: Text to check (should be pre-cleaned)
-            pattern: Compiled regex pattern for profanity
+            pattern: Compiled pattern for profanity. Uses the
+            processor's cached pattern if None.
 
         Returns:
             True if profanity is found, False otherwise
 
         This function is extracted to be testable without mocking.
         """
+        if pattern is None:
+            pattern = self._censor_pattern
         return bool(pattern.search(text))
 
     def _find_profane_segments(self, subs: List[srt.Subtitle]) -> List[Tuple[float, float]]:
         """Finds profane segments in a list of subtitles."""
-        censor_pattern = self._build_profanity_pattern(self.matching_words)
-        censor_segments = []
+        # Bind the per-subtitle calls once; this loop runs for every cue
+        clean = self._clean_subtitle_text
+        search = self._censor_pattern.search
+        censor_segments: List[Tuple[float, float]] = []
+        append = censor_segments.append
 
         for sub in subs:
-            cleaned_text = self._clean_subtitle_text(sub.content)
-            if self._contains_profanity(cleaned_text, censor_pattern):
-                logging.debug(f'Match found in subtitle #{sub.index}: "{cleaned_text}"')
-                start_s = sub.start.total_seconds()
-                end_s = sub.end.total_seconds()
-                censor_segments.append((start_s, end_s))
+            cleaned_text = clean(sub.content)
+            if search(cleaned_text):
+                logging.debug('Match found in subtitle #%s: "%s"', sub.index, cleaned_text)
+                append((sub.start.total_seconds(), sub.end.total_seconds()))
 
         return censor_segments
 
@@ -644,14 +949,17 @@ class GuardianProcessor:
 
         try:
             # Construct FFmpeg command to analyze audio segment with astats
+            # -ss/-t before -i seek the input, so only the segment is decoded and
+            # reaches astats; -vn skips decoding video altogether
             cmd = [
                 self.ffmpeg_cmd,
-                "-i",
-                video_path,
                 "-ss",
                 str(start),
                 "-t",
                 str(segment_duration),
+                "-i",
+                video_path,
+                "-vn",
                 "-af",
                 "astats=metadata=1:reset=1",
                 "-f",
@@ -717,6 +1025,110 @@ class GuardianProcessor:
             logging.info("=== END SILENCE VERIFICATION (ERROR) ===")
             return False, float("inf")
 
+    def _build_batch_astats_command(self, video_path: str, segments: List[Tuple[float, float]]) -> List[str]:
+        """
+        Build one FFmpeg command that runs astats over each segment separately.
+
+        Every segment becomes its own seeked input feeding its own astats
+        filter, so astats instance N reports on segment N. The filtered
+        streams are concatenated into a single null output.
+
+        Args:
+            video_path: Path to the video file to analyze
+            segments: List of (start, end) segments in seconds
+
+        Returns:
+            Complete FFmpeg command as list of strings
+
+        This function is extracted to be testable without mocking FFmpeg.
+        """
+        cmd = [self.ffmpeg_cmd]
+        for start, end in segments:
+            cmd.extend(["-ss", str(start), "-t", str(end - start), "-i", video_path])
+
+        branches = [f"[{index}:a]astats=metadata=1:reset=1[s{index}]" for index in range(len(segments))]
+        concat_inputs = "".join(f"[s{index}]" for index in range(len(segments)))
+        branches.append(f"{concat_inputs}concat=n={len(segments)}:v=0:a=1[out]")
+
+        cmd.extend(["-filter_complex", ";".join(branches), "-map", "[out]", "-f", "null", "-"])
+        return cmd
+
+    def _parse_batch_astats_output(self, stderr_output: str, segment_count: int) -> Optional[List[float]]:
+        """
+        Split batched astats output by filter instance and parse each RMS level.
+
+        Args:
+            stderr_output: The stderr output of a _build_batch_astats_command() run
+            segment_count: Number of segments in the batch
+
+        Returns:
+            RMS level in dB for each segment in order, or None if any segment
+            has no parseable astats report
+
+        This function is extracted to be testable without mocking subprocess.
+        """
+        instance_lines: Dict[int, List[str]] = {}
+        for line in stderr_output.splitlines():
+            match = self._ASTATS_INSTANCE_RE.match(line)
+            if match:
+                instance_lines.setdefault(int(match.group(1)), []).append(line)
+
+        rms_levels = []
+        for index in range(segment_count):
+            lines = instance_lines.get(index)
+            if not lines:
+                return None
+            rms_db = self._parse_astats_output("\n".join(lines))
+            if rms_db == float("inf"):
+                return None
+            rms_levels.append(rms_db)
+        return rms_levels
+
+    def _verify_silence_levels(
+        self, video_path: str, segments: List[Tuple[float, float]]
+    ) -> Optional[List[Tuple[bool, float]]]:
+        """
+        Verify many segments with one FFmpeg astats run per batch of segments.
+
+        Args:
+            video_path: Path to the video file to analyze
+            segments: List of (start, end) segments in seconds
+
+        Returns:
+            One (meets_threshold, actual_rms_db) tuple per segment, as
+            _verify_silence_level() returns, or None if the batched analysis
+            fails and segments should be verified one at a time
+        """
+        silence_threshold_db = -50.0
+        results = []
+
+        for offset in range(0, len(segments), self._VERIFY_BATCH_SIZE):
+            batch = segments[offset : offset + self._VERIFY_BATCH_SIZE]
+            cmd = self._build_batch_astats_command(video_path, batch)
+            logging.debug(f"Executing batched astats analysis for {len(batch)} segments")
+
+            try:
+                process = subprocess.run(cmd, capture_output=True, text=True, check=False)
+            except (OSError, subprocess.SubprocessError) as e:
+                logging.warning("Batched silence verification failed: %s", e)
+                return None
+
+            rms_levels = self._parse_batch_astats_output(process.stderr, len(batch))
+            if process.returncode != 0 or rms_levels is None:
+                logging.warning("Batched silence verification unavailable, verifying segments individually")
+                logging.debug("Batched astats stderr:\n%s", process.stderr)
+                return None
+
+            for (start, end), rms_db in zip(batch, rms_levels):
+                meets_threshold = rms_db <= silence_threshold_db
+                logging.info(
+                    f"Segment {start:.3f}-{end:.3f}s: {rms_db:.2f} dB"
+                    f" ({'meets' if meets_threshold else 'exceeds'} {silence_threshold_db} dB threshold)"
+                )
+                results.append((meets_threshold, rms_db))
+
+        return results
+
     def _parse_astats_output(self, stderr_output: str) -> float:
         """
         Parses FFmpeg astats output to extract RMS level in dB.
@@ -801,34 +1213,8 @@ class GuardianProcessor:
         Returns:
             Dictionary containing filter configuration
         """
-        strategies = {
-            1: {
-                "name": "Basic Volume Reduction",
-                "volume_filter": "volume=0",
-                "use_format_normalization": False,
-                "use_compression": False,
-                "use_null_mixing": False,
-                "description": "Simple volume=0 filter (legacy approach)",
-            },
-            2: {
-                "name": "Enhanced Silence",
-                "volume_filter": "volume=-80dB",
-                "use_format_normalization": True,
-                "use_compression": True,
-                "use_null_mixing": False,
-                "description": ("Very low volume reduction with format normalization and" " compression"),
-            },
-            3: {
-                "name": "Aggressive Null Mixing",
-                "volume_filter": "volume=0",
-                "use_format_normalization": True,
-                "use_compression": True,
-                "use_null_mixing": True,
-                "description": ("Complete silence with null source mixing and multiple processing" " stages"),
-            },
-        }
-
-        return strategies.get(strategy_level, strategies[2])  # Default to enhanced
+        # Copy so callers cannot modify the shared table
+        return dict(self._FILTER_STRATEGIES.get(strategy_level, self._FILTER_STRATEGIES[2]))  # Default to enhanced
 
     def _attempt_censoring_with_fallback(
         self,
@@ -881,8 +1267,14 @@ class GuardianProcessor:
                 all_segments_pass = True
 
                 if verify:
-                    for start_s, end_s in censor_segments:
-                        meets_threshold, actual_rms_db = self._verify_silence_level(output_path, start_s, end_s)
+                    # One FFmpeg run per batch of segments, else one run per segment
+                    segment_checks = self._verify_silence_levels(output_path, censor_segments)
+                    if segment_checks is None:
+                        segment_checks = [
+                            self._verify_silence_level(output_path, start_s, end_s)
+                            for start_s, end_s in censor_segments
+                        ]
+                    for (start_s, end_s), (meets_threshold, actual_rms_db) in zip(censor_segments, segment_checks):
                         verification_results.append((start_s, end_s, actual_rms_db))
 
                         if not meets_threshold:
@@ -1270,11 +1662,35 @@ class GuardianProcessor:
 
         This function is extracted to be testable without mocking FFmpeg.
         """
-        volume_filters = []
-        for start_s, end_s in segments:
-            volume_filter = f"{volume_setting}:enable={quote_char}" f"between(t,{start_s},{end_s}){quote_char}"
-            volume_filters.append(volume_filter)
-        return volume_filters
+        # Format the per-segment constant part once
+        prefix = f"{volume_setting}:enable={quote_char}between(t,"
+        return [f"{prefix}{start_s},{end_s}){quote_char}" for start_s, end_s in segments]
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_chain_template(cls, strategy_level: int) -> Tuple[str, str]:
+        """
+        Return the fixed filters placed before and after the volume filters.
+
+        The (prefix, suffix) pair depends only on the class constants, so it
+        is assembled once per class and level and reused for every filter chain.
+
+        Args:
+            strategy_level: Strategy level (1=basic, 2=enhanced, 3=aggressive)
+
+        Returns:
+            Tuple of (prefix, suffix) filter strings, either of which may be empty
+        """
+        strategy = cls._FILTER_STRATEGIES.get(strategy_level, cls._FILTER_STRATEGIES[2])
+        # Format normalization runs ahead of the volume filters
+        prefix = cls._FORMAT_NORMALIZATION_FILTER if strategy["use_format_normalization"] else ""
+        suffix_parts = []
+        # Dynamic range compression, then the additional null mixing stages
+        if strategy["use_compression"]:
+            suffix_parts.append(cls._COMPRESSION_FILTER)
+        if strategy["use_null_mixing"]:
+            suffix_parts.extend(cls._NULL_MIXING_FILTERS)
+        return prefix, ",".join(suffix_parts)
 
     def _build_audio_filter_chain(self, segments: List[Tuple[float, float]], strategy_level: int) -> str:
         """
@@ -1290,31 +1706,12 @@ class GuardianProcessor:
         This function is extracted to be testable without mocking FFmpeg.
         """
         strategy = self._get_filter_strategy(strategy_level)
-        filter_parts = []
-        quote_char = "'"
-
-        # Add format normalization filter if enabled
-        if strategy["use_format_normalization"]:
-            filter_parts.append("aformat=sample_fmts=s16:channel_layouts=stereo")
+        prefix, suffix = self._get_chain_template(strategy_level)
 
-        # Add volume filters for censored segments
-        volume_filters = self._build_volume_filters(segments, strategy["volume_filter"], quote_char)
-        filter_parts.extend(volume_filters)
-
-        # Add dynamic range compression filter if enabled
-        if strategy["use_compression"]:
-            filter_parts.append("acompressor=threshold=-20dB:ratio=20:attack=5:release=50")
-
-        # Add additional null mixing processing if enabled
-        if strategy["use_null_mixing"]:
-            null_processing_stages = [
-                "volume=-60dB",  # First stage: very low volume
-                "volume=0",  # Second stage: zero volume
-                "agate=threshold=-90dB:ratio=10:attack=1:release=10",  # Noise gate
-            ]
-            filter_parts.extend(null_processing_stages)
+        # Add volume filters for censored segments between the fixed stages
+        volume_filters = ",".join(self._build_volume_filters(segments, strategy["volume_filter"], "'"))
 
-        return ",".join(filter_parts) if filter_parts else "anull"
+        return ",".join(part for part in (prefix, volume_filters, suffix) if part) or "anull"
 
     def _build_ffmpeg_base_command(self, video_path: str, output_path: str, audio_filter_graph: str) -> List[str]:
         """
@@ -1334,19 +1731,10 @@ class GuardianProcessor:
             self.ffmpeg_cmd,
             "-i",
             video_path,
-            "-c:v",
-            "copy",
-            "-c:a",
-            "aac",
-            "-b:a",
-            "192k",
+            *self._FFMPEG_CODEC_ARGS,
             "-af",
             audio_filter_graph,
-            "-map_metadata",
-            "-1",
-            "-movflags",
-            "+faststart",
-            "-y",
+            *self._FFMPEG_OUTPUT_ARGS,
             output_path,
         ]
 
@@ -9,6 +9,8 @@ import subprocess
 
 import pytest
 
+from guardian.core import GuardianProcessor
+
 
 @pytest.fixture(scope="session", autouse=True)
 def verify_ffmpeg_available(request):
@@ -62,3 +64,15 @@ def verify_ffmpeg_available(request):
             pytest.fail(f"Failed to run FFmpeg: {e}", pytrace=False)
 
         print("FFmpeg verification complete.")
+
+
+@pytest.fixture(scope="session")
+def shared_processor():
+    """A GuardianProcessor shared by tests that only call its pure methods."""
+    return GuardianProcessor()
+
+
+@pytest.fixture
+def processor():
+    """A GuardianProcessor with the default word list, fresh for tests that patch it."""
+    return GuardianProcessor()
@@ -38,6 +38,11 @@ class TestGuardianProcessor(unittest.TestCase):
         self.assertEqual(
             processor.matching_words, GuardianProcessor.DEFAULT_MATCHING_WORDS
         )
+        # The default pattern is compiled once and shared across processors
+        self.assertIs(
+            processor._censor_pattern, GuardianProcessor.default_censor_pattern()
+        )
+        self.assertIs(GuardianProcessor()._censor_pattern, processor._censor_pattern)
 
         # Check if local binaries exist and adjust assertions accordingly
         bin_dir = Path(__file__).parent.parent / "bin"
@@ -69,6 +74,22 @@ class TestGuardianProcessor(unittest.TestCase):
         self.assertEqual(processor.ffmpeg_cmd, "/usr/bin/ffmpeg")
         self.assertEqual(processor.ffprobe_cmd, "/usr/bin/ffprobe")
 
+    def test_assigning_matching_words_rebuilds_pattern(self):
+        """Test that a new word list takes effect without building a new processor"""
+        processor = GuardianProcessor()
+        self.assertTrue(processor._contains_profanity("what the hell"))
+
+        processor.matching_words = ["badword"]
+
+        self.assertEqual(processor.matching_words, ["badword"])
+        self.assertTrue(processor._contains_profanity("a badword here"))
+        self.assertFalse(processor._contains_profanity("what the hell"))
+
+        processor.matching_words = GuardianProcessor.DEFAULT_MATCHING_WORDS
+        self.assertIs(
+            processor._censor_pattern, GuardianProcessor.default_censor_pattern()
+        )
+
     @patch("os.path.exists")
     def test_process_video_file_not_found(self, mock_exists):
         """Test process_video with non-existent file"""
@@ -209,6 +230,42 @@ class TestGuardianProcessor(unittest.TestCase):
             match = compiled_pattern.search(text.lower())
             self.assertEqual(bool(match), should_match, f"Failed for text: {text}")
 
+    def test_get_video_details_cached_until_file_changes(self):
+        """Test that video details are probed once per file version"""
+        video_path = Path(self.temp_dir) / "video.mp4"
+        video_path.write_bytes(b"v1")
+        details = {"duration": "120.5", "width": "1920"}
+
+        with patch.object(
+            self.processor, "_probe_video_details", return_value=details
+        ) as mock_probe:
+            first = self.processor.get_video_details(str(video_path))
+            first["width"] = "changed"
+            second = self.processor.get_video_details(str(video_path))
+
+            self.assertEqual(mock_probe.call_count, 1)
+            self.assertEqual(second, details)
+
+            # A different size invalidates the cached entry
+            video_path.write_bytes(b"version 2")
+            self.processor.get_video_details(str(video_path))
+            self.assertEqual(mock_probe.call_count, 2)
+
+    def test_get_video_details_failure_not_cached(self):
+        """Test that failed probes are retried and missing files are not cached"""
+        video_path = Path(self.temp_dir) / "video.mp4"
+        video_path.write_bytes(b"v1")
+
+        with patch.object(
+            self.processor, "_probe_video_details", return_value=None
+        ) as mock_probe:
+            self.assertIsNone(self.processor.get_video_details(str(video_path)))
+            self.assertIsNone(self.processor.get_video_details(str(video_path)))
+            self.assertIsNone(self.processor.get_video_details("/missing/video.mp4"))
+
+            self.assertEqual(mock_probe.call_count, 3)
+        self.assertEqual(self.processor._video_details_cache, {})
+
 
 if __name__ == "__main__":
     unittest.main()
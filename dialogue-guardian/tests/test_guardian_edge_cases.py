@@ -5,6 +5,7 @@
 Edge case tests for guardian functionality
 """
 
+import json
 import os
 import tempfile
 import unittest
@@ -12,6 +13,18 @@ from unittest.mock import MagicMock, mock_open, patch
 
 from guardian.core import GuardianProcessor
 
+_VIDEO_STREAM = {
+    "codec_type": "video",
+    "width": 1920,
+    "height": 1080,
+    "r_frame_rate": "30000/1001",
+}
+
+
+def _probe_json(streams, duration="120.5"):
+    """Build the JSON ffprobe prints for get_video_details"""
+    return json.dumps({"streams": streams, "format": {"duration": duration}})
+
 
 class TestGuardianEdgeCases(unittest.TestCase):
     """Edge case test cases for Guardian functionality"""
@@ -31,11 +44,13 @@ class TestGuardianEdgeCases(unittest.TestCase):
     @patch("subprocess.check_output")
     def test_get_video_details_malformed_audio_stream(self, mock_check_output):
         """Test video details with malformed audio stream data"""
-        mock_check_output.side_effect = [
-            "120.5",  # duration
-            "malformed|audio|data\n|incomplete|",  # malformed audio info
-            "1920\n1080\n30000/1001",  # video info
-        ]
+        mock_check_output.return_value = _probe_json(
+            [
+                {"codec_type": "audio", "codec_name": "malformed", "channels": "data"},
+                {"codec_type": "audio"},  # incomplete
+                _VIDEO_STREAM,
+            ]
+        )
 
         result = self.processor.get_video_details(self.test_video_path)
 
@@ -46,11 +61,26 @@ class TestGuardianEdgeCases(unittest.TestCase):
     @patch("subprocess.check_output")
     def test_get_video_details_zero_channels(self, mock_check_output):
         """Test video details with zero channel audio streams"""
-        mock_check_output.side_effect = [
-            "120.5",  # duration
-            "aac|44100|0|none\naac|48000|2|stereo",  # zero channels then valid
-            "1920\n1080\n30000/1001",  # video info
-        ]
+        mock_check_output.return_value = _probe_json(
+            [
+                # zero channels then valid
+                {
+                    "codec_type": "audio",
+                    "codec_name": "aac",
+                    "sample_rate": "44100",
+                    "channels": 0,
+                    "channel_layout": "none",
+                },
+                {
+                    "codec_type": "audio",
+                    "codec_name": "aac",
+                    "sample_rate": "48000",
+                    "channels": 2,
+                    "channel_layout": "stereo",
+                },
+                _VIDEO_STREAM,
+            ]
+        )
 
         result = self.processor.get_video_details(self.test_video_path)
 
@@ -62,11 +92,25 @@ class TestGuardianEdgeCases(unittest.TestCase):
     @patch("subprocess.check_output")
     def test_get_video_details_non_numeric_channels(self, mock_check_output):
         """Test video details with non-numeric channel data"""
-        mock_check_output.side_effect = [
-            "120.5",  # duration
-            "aac|44100|unknown|stereo\naac|48000|2|stereo",  # non-numeric then valid
-            "1920\n1080\n30000/1001",  # video info
-        ]
+        mock_check_output.return_value = _probe_json(
+            [
+                # non-numeric then valid
+                {
+                    "codec_type": "audio",
+                    "codec_name": "aac",
+                    "sample_rate": "44100",
+                    "channels": "unknown",
+                },
+                {
+                    "codec_type": "audio",
+                    "codec_name": "aac",
+                    "sample_rate": "48000",
+                    "channels": 2,
+                    "channel_layout": "stereo",
+                },
+                _VIDEO_STREAM,
+            ]
+        )
 
         result = self.processor.get_video_details(self.test_video_path)
 
@@ -77,11 +121,24 @@ class TestGuardianEdgeCases(unittest.TestCase):
     @patch("subprocess.check_output")
     def test_get_video_details_framerate_division_by_zero(self, mock_check_output):
         """Test video details with zero denominator in framerate"""
-        mock_check_output.side_effect = [
-            "120.5",  # duration
-            "aac|44100|2|stereo",  # audio info
-            "1920\n1080\n30000/0",  # video info with zero denominator
-        ]
+        mock_check_output.return_value = _probe_json(
+            [
+                {
+                    "codec_type": "audio",
+                    "codec_name": "aac",
+                    "sample_rate": "44100",
+                    "channels": 2,
+                    "channel_layout": "stereo",
+                },
+                # video info with zero denominator
+                {
+                    "codec_type": "video",
+                    "width": 1920,
+                    "height": 1080,
+                    "r_frame_rate": "30000/0",
+                },
+            ]
+        )
 
         # This should not crash, but handle the division by zero gracefully
         result = self.processor.get_video_details(self.test_video_path)
@@ -90,7 +147,7 @@ class TestGuardianEdgeCases(unittest.TestCase):
         self.assertIsNotNone(result)
 
     @patch("subprocess.check_output")
-    @patch("json.loads")
+    @patch("guardian.core._loads")
     def test_extract_embedded_srt_unexpected_exception(
         self, mock_json_loads, mock_check_output
     ):
@@ -105,7 +162,7 @@ class TestGuardianEdgeCases(unittest.TestCase):
         self.assertFalse(result)
 
     @patch("subprocess.check_output")
-    @patch("json.loads")
+    @patch("guardian.core._loads")
     def test_extract_embedded_srt_missing_streams_key(
         self, mock_json_loads, mock_check_output
     ):
@@ -120,7 +177,7 @@ class TestGuardianEdgeCases(unittest.TestCase):
         self.assertFalse(result)
 
     @patch("subprocess.check_output")
-    @patch("json.loads")
+    @patch("guardian.core._loads")
     def test_extract_embedded_srt_streams_not_list(
         self, mock_json_loads, mock_check_output
     ):
@@ -6,20 +6,25 @@ Unit tests for pure functions extracted from guardian.core module.
 These tests don't use mocks and test the actual logic.
 """
 
+import re
 import unittest
 from datetime import timedelta
+from unittest.mock import patch
 
+import pytest
 import srt
 
+from guardian import core
 from guardian.core import GuardianProcessor
 
 
 class TestGuardianPureFunctions(unittest.TestCase):
     """Test cases for pure functions that don't require mocking"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.processor = GuardianProcessor()
+    @classmethod
+    def setUpClass(cls):
+        """Set up one processor shared by all tests; the methods under test are pure"""
+        cls.processor = GuardianProcessor()
 
     def test_parse_duration(self):
         """Test parsing duration output from ffprobe"""
@@ -47,8 +52,16 @@ class TestGuardianPureFunctions(unittest.TestCase):
 
     def test_parse_audio_streams_single_stream(self):
         """Test parsing single audio stream"""
-        ffprobe_output = "aac|44100|2|stereo"
-        result = self.processor._parse_audio_streams(ffprobe_output)
+        streams = [
+            {
+                "codec_type": "audio",
+                "codec_name": "aac",
+                "sample_rate": "44100",
+                "channels": 2,
+                "channel_layout": "stereo",
+            }
+        ]
+        result = self.processor._parse_audio_streams(streams)
 
         expected = {
             "codec": "aac",
@@ -60,8 +73,30 @@ class TestGuardianPureFunctions(unittest.TestCase):
 
     def test_parse_audio_streams_multiple_streams(self):
         """Test parsing multiple audio streams - picks one with most channels"""
-        ffprobe_output = "aac|44100|1|mono\naac|48000|6|5.1\nmp3|22050|2|stereo"
-        result = self.processor._parse_audio_streams(ffprobe_output)
+        streams = [
+            {
+                "codec_type": "audio",
+                "codec_name": "aac",
+                "sample_rate": "44100",
+                "channels": 1,
+                "channel_layout": "mono",
+            },
+            {
+                "codec_type": "audio",
+                "codec_name": "aac",
+                "sample_rate": "48000",
+                "channels": 6,
+                "channel_layout": "5.1",
+            },
+            {
+                "codec_type": "audio",
+                "codec_name": "mp3",
+                "sample_rate": "22050",
+                "channels": 2,
+                "channel_layout": "stereo",
+            },
+        ]
+        result = self.processor._parse_audio_streams(streams)
 
         # Should pick the 6-channel stream
         expected = {
@@ -74,10 +109,25 @@ class TestGuardianPureFunctions(unittest.TestCase):
 
     def test_parse_audio_streams_malformed_data(self):
         """Test parsing malformed audio stream data"""
-        ffprobe_output = "malformed|data\n|incomplete|\naac|44100|2|stereo"
-        result = self.processor._parse_audio_streams(ffprobe_output)
+        streams = [
+            {"codec_type": "audio", "codec_name": "malformed"},
+            {
+                "codec_type": "video",
+                "codec_name": "h264",
+                "width": 1920,
+                "height": 1080,
+            },
+            {
+                "codec_type": "audio",
+                "codec_name": "aac",
+                "sample_rate": "44100",
+                "channels": 2,
+                "channel_layout": "stereo",
+            },
+        ]
+        result = self.processor._parse_audio_streams(streams)
 
-        # Should pick the valid stream
+        # Should pick the valid audio stream
         expected = {
             "codec": "aac",
             "samplerate": "44100",
@@ -88,8 +138,22 @@ class TestGuardianPureFunctions(unittest.TestCase):
 
     def test_parse_audio_streams_non_numeric_channels(self):
         """Test parsing audio streams with non-numeric channel data"""
-        ffprobe_output = "aac|44100|unknown|stereo\naac|48000|2|stereo"
-        result = self.processor._parse_audio_streams(ffprobe_output)
+        streams = [
+            {
+                "codec_type": "audio",
+                "codec_name": "aac",
+                "sample_rate": "44100",
+                "channels": "unknown",
+            },
+            {
+                "codec_type": "audio",
+                "codec_name": "aac",
+                "sample_rate": "48000",
+                "channels": 2,
+                "channel_layout": "stereo",
+            },
+        ]
+        result = self.processor._parse_audio_streams(streams)
 
         # Should skip non-numeric and pick valid stream
         expected = {
@@ -100,9 +164,19 @@ class TestGuardianPureFunctions(unittest.TestCase):
         }
         self.assertEqual(result, expected)
 
+    def test_parse_audio_streams_equal_channels_keeps_first(self):
+        """Test that the first stream wins when channel counts tie"""
+        streams = [
+            {"codec_type": "audio", "codec_name": "aac", "channels": 2},
+            {"codec_type": "audio", "codec_name": "ac3", "channels": 2},
+        ]
+        result = self.processor._parse_audio_streams(streams)
+
+        self.assertEqual(result["codec"], "aac")
+
     def test_parse_audio_streams_empty_input(self):
         """Test parsing empty audio stream data"""
-        result = self.processor._parse_audio_streams("")
+        result = self.processor._parse_audio_streams([])
 
         expected = {"codec": "", "samplerate": "", "channels": "", "audioconfig": ""}
         self.assertEqual(result, expected)
@@ -129,6 +203,26 @@ class TestGuardianPureFunctions(unittest.TestCase):
         }
         self.assertEqual(result, expected)
 
+    def test_parse_framerate_info_decimal_rounding(self):
+        """Test that decimal framerates are rounded, not truncated, to milli-fps"""
+        result = self.processor._parse_framerate_info("29.97")
+
+        expected = {
+            "framerate": "29970/1000",
+            "fps": "29.970",
+            "frameduration": "1000/29970",
+        }
+        self.assertEqual(result, expected)
+
+    def test_parse_framerate_info_non_finite(self):
+        """Test that non-finite decimal framerates are rejected"""
+        for framerate in ("nan", "inf"):
+            with self.subTest(framerate=framerate):
+                result = self.processor._parse_framerate_info(framerate)
+
+                expected = {"framerate": None, "fps": None, "frameduration": None}
+                self.assertEqual(result, expected)
+
     def test_parse_framerate_info_division_by_zero(self):
         """Test parsing framerate with zero denominator"""
         result = self.processor._parse_framerate_info("30000/0")
@@ -150,10 +244,18 @@ class TestGuardianPureFunctions(unittest.TestCase):
         expected = {"framerate": None, "fps": None, "frameduration": None}
         self.assertEqual(result, expected)
 
-    def test_parse_video_stream_output_complete(self):
-        """Test parsing complete video stream output"""
-        ffprobe_output = "1920\n1080\n30000/1001"
-        result = self.processor._parse_video_stream_output(ffprobe_output)
+    def test_parse_video_stream_complete(self):
+        """Test parsing a complete video stream entry"""
+        streams = [
+            {"codec_type": "audio", "codec_name": "aac", "channels": 2},
+            {
+                "codec_type": "video",
+                "width": 1920,
+                "height": 1080,
+                "r_frame_rate": "30000/1001",
+            },
+        ]
+        result = self.processor._parse_video_stream(streams)
 
         expected = {
             "width": "1920",
@@ -164,10 +266,10 @@ class TestGuardianPureFunctions(unittest.TestCase):
         }
         self.assertEqual(result, expected)
 
-    def test_parse_video_stream_output_incomplete(self):
-        """Test parsing incomplete video stream output"""
-        ffprobe_output = "1920"
-        result = self.processor._parse_video_stream_output(ffprobe_output)
+    def test_parse_video_stream_incomplete(self):
+        """Test parsing an incomplete video stream entry"""
+        streams = [{"codec_type": "video", "width": 1920}]
+        result = self.processor._parse_video_stream(streams)
 
         expected = {
             "width": "1920",
@@ -178,6 +280,29 @@ class TestGuardianPureFunctions(unittest.TestCase):
         }
         self.assertEqual(result, expected)
 
+    def test_parse_video_details(self):
+        """Test parsing ffprobe's combined format and stream JSON"""
+        probe_output = (
+            '{"streams": [{"codec_type": "video", "width": 1280, "height": 720, "r_frame_rate": "24/1"},'
+            ' {"codec_type": "audio", "codec_name": "aac", "sample_rate": "22050", "channels": 1,'
+            ' "channel_layout": "mono"}], "format": {"duration": "9.495011"}}'
+        )
+        result = self.processor._parse_video_details(probe_output)
+
+        expected = {
+            "duration": "9.495011",
+            "codec": "aac",
+            "samplerate": "22050",
+            "channels": "1",
+            "audioconfig": "mono",
+            "width": "1280",
+            "height": "720",
+            "framerate": "24/1",
+            "fps": "24.000",
+            "frameduration": "1/24",
+        }
+        self.assertEqual(result, expected)
+
     def test_parse_ffprobe_streams_valid_json(self):
         """Test parsing valid JSON from ffprobe"""
         json_output = '{"streams": [{"index": 2, "codec_name": "subrip"}]}'
@@ -269,20 +394,14 @@ class TestGuardianPureFunctions(unittest.TestCase):
         ]
         self.assertEqual(result, expected)
 
-    def test_clean_subtitle_text(self):
-        """Test cleaning subtitle text"""
-        test_cases = [
-            ("Hello, world!", "hello world"),
-            ("What the f*ck?!", "what the fck"),
-            ("Test... with [brackets]", "test with brackets"),
-            ("UPPERCASE text", "uppercase text"),
-            ("Text with 'apostrophes'", "text with 'apostrophes'"),
-        ]
+    def test_clean_subtitle_text_matches_regex_semantics(self):
+        """Test cleaning keeps exactly what [^\\w\\s'] would keep"""
+        text = "".join(chr(i) for i in range(0x3000)) + "Ça va? Ünïcödé — naïve_1² 'ok'"
+        expected = re.sub(r"[^\w\s\']", "", text).lower()
 
-        for input_text, expected in test_cases:
-            with self.subTest(input_text=input_text):
-                result = self.processor._clean_subtitle_text(input_text)
-                self.assertEqual(result, expected)
+        self.assertEqual(self.processor._clean_subtitle_text(text), expected)
+        # Word-final sigma only lowercases correctly over the whole string
+        self.assertEqual(self.processor._clean_subtitle_text("ΟΔΟΣ!"), "οδος")
 
     def test_build_profanity_pattern(self):
         """Test building profanity regex pattern"""
@@ -303,6 +422,55 @@ class TestGuardianPureFunctions(unittest.TestCase):
         self.assertTrue(pattern.search("FUCK"))
         self.assertTrue(pattern.search("Shit"))
 
+    def test_build_profanity_pattern_is_cached(self):
+        """Test that equal word lists share one compiled pattern"""
+        first = self.processor._build_profanity_pattern(["fuck", "fucking", "shit"])
+        second = self.processor._build_profanity_pattern(["shit", "fucking", "fuck"])
+
+        self.assertIs(first, second)
+
+    @patch("guardian.core.ahocorasick", None)
+    def test_build_profanity_pattern_prefers_longest_word(self):
+        """Test that unsorted words are reordered so the longest alternative wins"""
+        # Shortest first; the regex only reaches "jesus christ" if the list is sorted.
+        # Not the default list, whose matcher may already be cached as an automaton.
+        pattern = GuardianProcessor._build_profanity_pattern(
+            ["jesus", "holy", "jesus christ"]
+        )
+
+        match = pattern.search("jesus christ almighty")
+        self.assertEqual(match.group(1), "jesus christ")
+
+    @unittest.skipIf(core.ahocorasick is None, "pyahocorasick not installed")
+    def test_aho_corasick_pattern_matches_regex(self):
+        """Test that the Aho-Corasick matcher agrees with the regex"""
+        words = tuple(GuardianProcessor.DEFAULT_MATCHING_WORDS) + (
+            "god damn",
+            "jack off",
+        )
+        automaton = core._AhoCorasickPattern(words)
+        regex = core._compile_profanity_regex(words)
+        texts = [
+            "this is fucking bad",
+            "SHIT happens",
+            "shitty content",
+            "damnation",
+            "a goddamn mess",
+            "god damn it",
+            "jack offers help",
+            "bullshit_",
+            "what the hell's going on",
+            "clean content",
+            "",
+        ]
+
+        for text in texts:
+            with self.subTest(text=text):
+                self.assertEqual(
+                    automaton.search(text) is not None,
+                    regex.search(text) is not None,
+                )
+
     def test_build_profanity_pattern_empty_words(self):
         """Test building profanity pattern with empty word list"""
         pattern = self.processor._build_profanity_pattern([])
@@ -311,26 +479,12 @@ class TestGuardianPureFunctions(unittest.TestCase):
         self.assertFalse(pattern.search("any text"))
         self.assertFalse(pattern.search("fuck shit damn"))
 
-    def test_contains_profanity(self):
-        """Test profanity detection in text"""
-        words = ["fucking", "fuck", "shit", "damn"]
-        pattern = self.processor._build_profanity_pattern(words)
+    def test_contains_profanity_uses_processor_pattern(self):
+        """Test that profanity detection defaults to the processor's word list"""
+        processor = GuardianProcessor(matching_words=["badword"])
 
-        test_cases = [
-            ("this is fucking bad", True),  # Should match "fucking"
-            ("this is fuck bad", True),  # Should match "fuck"
-            ("clean content", False),
-            ("what the hell", False),  # "hell" not in our test words
-            ("damn it", True),
-            ("", False),
-            ("this is shit", True),  # Exact word match
-            ("shitty content", False),  # Partial word should not match
-        ]
-
-        for text, expected in test_cases:
-            with self.subTest(text=text):
-                result = self.processor._contains_profanity(text, pattern)
-                self.assertEqual(result, expected)
+        self.assertTrue(processor._contains_profanity("a badword here"))
+        self.assertFalse(processor._contains_profanity("this is fucking bad"))
 
     def test_build_volume_filters(self):
         """Test building volume filter strings"""
@@ -433,6 +587,51 @@ class TestGuardianPureFunctions(unittest.TestCase):
         self.assertIn("aac", result)
         self.assertIn("-af", result)
 
+    def test_build_batch_astats_command(self):
+        """Test building one astats command for several segments"""
+        result = self.processor._build_batch_astats_command(
+            "/input/video.mp4", [(1.0, 2.5), (4.0, 5.0)]
+        )
+
+        self.assertEqual(result.count("-i"), 2)
+        self.assertEqual(
+            result[1:7], ["-ss", "1.0", "-t", "1.5", "-i", "/input/video.mp4"]
+        )
+        self.assertEqual(
+            result[7:13], ["-ss", "4.0", "-t", "1.0", "-i", "/input/video.mp4"]
+        )
+        filter_graph = result[result.index("-filter_complex") + 1]
+        self.assertEqual(
+            filter_graph,
+            "[0:a]astats=metadata=1:reset=1[s0];"
+            "[1:a]astats=metadata=1:reset=1[s1];"
+            "[s0][s1]concat=n=2:v=0:a=1[out]",
+        )
+
+    def test_parse_batch_astats_output(self):
+        """Test splitting batched astats output by filter instance"""
+        stderr_output = (
+            "[Parsed_astats_0 @ 0x1] Overall\n"
+            "[Parsed_astats_0 @ 0x1] RMS level dB: -62.5\n"
+            "[Parsed_astats_1 @ 0x2] Overall\n"
+            "[Parsed_astats_1 @ 0x2] RMS level dB: -31.079741\n"
+            "[Parsed_concat_2 @ 0x3] done\n"
+        )
+        result = self.processor._parse_batch_astats_output(stderr_output, 2)
+
+        self.assertEqual(result, [-62.5, -31.079741])
+
+    def test_parse_batch_astats_output_missing_segment(self):
+        """Test that a missing astats report rejects the whole batch"""
+        stderr_output = "[Parsed_astats_0 @ 0x1] RMS level dB: -62.5\n"
+
+        self.assertIsNone(self.processor._parse_batch_astats_output(stderr_output, 2))
+        self.assertIsNone(
+            self.processor._parse_batch_astats_output(
+                "lavfi.astats.Overall.RMS_level: -55.3", 1
+            )
+        )
+
     def test_find_profane_segments_integration(self):
         """Test complete profane segment detection with real subtitles"""
         # Create test subtitles
@@ -464,5 +663,41 @@ class TestGuardianPureFunctions(unittest.TestCase):
         self.assertEqual(result, expected)
 
 
+@pytest.mark.parametrize(
+    "input_text,expected",
+    [
+        ("Hello, world!", "hello world"),
+        ("What the f*ck?!", "what the fck"),
+        ("Test... with [brackets]", "test with brackets"),
+        ("UPPERCASE text", "uppercase text"),
+        ("Text with 'apostrophes'", "text with 'apostrophes'"),
+    ],
+)
+def test_clean_subtitle_text(shared_processor, input_text, expected):
+    """Test cleaning subtitle text"""
+    assert shared_processor._clean_subtitle_text(input_text) == expected
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("this is fucking bad", True),  # Should match "fucking"
+        ("this is fuck bad", True),  # Should match "fuck"
+        ("clean content", False),
+        ("what the hell", False),  # "hell" not in our test words
+        ("damn it", True),
+        ("", False),
+        ("this is shit", True),  # Exact word match
+        ("shitty content", False),  # Partial word should not match
+    ],
+)
+def test_contains_profanity(shared_processor, text, expected):
+    """Test profanity detection in text"""
+    pattern = shared_processor._build_profanity_pattern(
+        ["fucking", "fuck", "shit", "damn"]
+    )
+    assert shared_processor._contains_profanity(text, pattern) == expected
+
+
 if __name__ == "__main__":
     unittest.main()